@@ -11,17 +11,19 @@ Clean Names GUI (v 2.9.2 – kitchen-sink)
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import shutil
+import stat
+import string
+import struct
 import sys
 import time
-import webbrowser
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import AbstractSet, Dict, FrozenSet, Iterator, List, Set, Tuple
 
 from PySide6.QtCore    import (
     Qt,
@@ -29,15 +31,17 @@ from PySide6.QtCore    import (
     QAbstractTableModel,
     QByteArray,
     QFileSystemWatcher,
+    QObject,
+    QRunnable,
     QSettings,
     QSortFilterProxyModel,
     QStandardPaths,
-    QThread,
+    QThreadPool,
     QTimer,
     QModelIndex,
     Signal,
 )
-from PySide6.QtGui     import QColor, QIcon, QPalette
+from PySide6.QtGui     import QColor, QIcon, QPalette, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -82,9 +86,15 @@ HELP_PNG   = ASSETS / "help.png"
 INFO_PNG   = ASSETS / "info.png"
 CHECK_PNG  = ASSETS / "checkmark.png"
 HELP_HTML  = Path(__file__).with_name("help.html")
+HELP_URI   = HELP_HTML.resolve().as_uri() if HELP_HTML.exists() else None   # ships with the app
+UNDO_LOG   = "last_batch.bin"   # in the app config dir
+UNDO_LOG_JSON = "last_batch.json"   # older JSON log, still read once after an upgrade
 
-DEFAULT_BAD_CHARS: Set[str] = set("\"#%*:<>?/|")
+DEFAULT_BAD_CHARS: FrozenSet[str] = frozenset("\"#%*:<>?/|")
 DEFAULT_EXTS      = (".txt", ".py", ".md", ".csv", ".json")
+_DEFAULT_EXT_PAYLOAD = tuple((e, False) for e in DEFAULT_EXTS)
+_EXT_ITEM_FLAGS   = (Qt.ItemIsSelectable | Qt.ItemIsEnabled |
+                     Qt.ItemIsUserCheckable | Qt.ItemNeverHasChildren)
 PHOTO_EXTS        = {".jpg", ".jpeg", ".tif", ".tiff", ".png"}
 WIN_RESERVED      = {
     "con","prn","aux","nul",
@@ -93,6 +103,10 @@ WIN_RESERVED      = {
 }
 
 ICON_COL_WIDTH = 24
+ICON_PX        = 16     # table icon size
+
+# spaces/tabs become "_" and underscore runs collapse – in one pass
+_COLLAPSE_RE = re.compile(r'[ \t_]+', re.ASCII)
 
 # optional Pillow for metadata mode
 try:
@@ -100,9 +114,27 @@ try:
 except ImportError:
     Image = None
 
+# optional orjson for settings (de)serialisation
+try:
+    import orjson  # type: ignore
+    _jloads = orjson.loads
+    def _jdumps(obj) -> str: return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+    _jloads, _jdumps = json.loads, json.dumps
+
 # ────────── icon cache & helpers ──────────────────────────────────────
-_ICON_CACHE: Dict[str, QIcon] = {}
 _MISSING_ICONS: Set[str] = set()
+_NULL_ICON = QIcon()
+
+def _list_icons() -> frozenset[str]:
+    # one listdir up front instead of an exists() per icon name
+    try:
+        return frozenset(os.listdir(ICONS_DIR))
+    except OSError:
+        return frozenset()
+
+_ICONS_PRESENT = _list_icons()
 
 CATEGORY_MAP = {
     "image.png":   {"jpg","jpeg","png","gif","bmp","tif","tiff","webp"},
@@ -115,52 +147,90 @@ CATEGORY_MAP = {
 _EXT_TO_CATEGORY = {ext: cat for cat, exts in CATEGORY_MAP.items() for ext in exts}
 
 def _load_icon_file(name: str) -> QIcon:
-    path = ICONS_DIR / name
-    if path.exists():
-        return QIcon(str(path))
-    _MISSING_ICONS.add(name)
-    return QIcon()
-
-def _icon_for_path(p: Path) -> QIcon:
-    if p.is_dir():
-        return _ICON_CACHE.setdefault(
-            "__folder__",
-            _load_icon_file("folder.png") or QApplication.style().standardIcon(QStyle.SP_DirIcon)
-        )
-    ext = p.suffix.lstrip(".").lower()
+    if name not in _ICONS_PRESENT:
+        _MISSING_ICONS.add(name)
+        return _NULL_ICON
+    # keep one pre-scaled table-size pixmap per file in QPixmapCache, so
+    # painting never rescales the full-size PNG
+    full = QPixmap(str(ICONS_DIR / name))
+    if full.isNull():
+        _MISSING_ICONS.add(name)
+        return _NULL_ICON
+    key = f"{name}@{ICON_PX}"
+    small = QPixmapCache.find(key)
+    if small is None:
+        small = full.scaled(ICON_PX, ICON_PX, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, small)
+    icon = QIcon(small)
+    icon.addPixmap(full)     # larger sizes / HiDPI
+    return icon
+
+@lru_cache(maxsize=None)
+def _icon_file(name: str, fallback: QStyle.StandardPixmap | None = None) -> QIcon:
+    # one QIcon per PNG, shared by every extension that maps to it
+    icon = _load_icon_file(name)
+    if icon.isNull() and fallback is not None:
+        icon = QApplication.style().standardIcon(fallback)
+    return icon
+
+@lru_cache(maxsize=256)
+def _resolve_icon(ext: str, is_dir: bool) -> QIcon:
+    """Icon for a lower-case extension (no dot): exact ext → category → fallback."""
+    if is_dir:
+        return _icon_file("folder.png", QStyle.SP_DirIcon)
     if ext:
-        key = f"ext:{ext}"
-        if key not in _ICON_CACHE:
-            _ICON_CACHE[key] = _load_icon_file(f"{ext}.png")
-        if not _ICON_CACHE[key].isNull():
-            return _ICON_CACHE[key]
-    cat_file = _EXT_TO_CATEGORY.get(ext)
-    if cat_file:
-        return _ICON_CACHE.setdefault(cat_file, _load_icon_file(cat_file))
-    return _ICON_CACHE.setdefault(
-        "__file__",
-        _load_icon_file("file.png") or QApplication.style().standardIcon(QStyle.SP_FileIcon)
-    )
+        icon = _icon_file(f"{ext}.png")
+        if not icon.isNull():
+            return icon
+        cat_file = _EXT_TO_CATEGORY.get(ext)
+        if cat_file:
+            return _icon_file(cat_file)
+    return _icon_file("file.png", QStyle.SP_FileIcon)
+
+@lru_cache(maxsize=1)
+def _logo_icon() -> QIcon | None:
+    # decoded once, shared by the app and every window
+    return QIcon(str(LOGO_PNG)) if LOGO_PNG.exists() else None
+
+def _warm_icon_cache():
+    # resolve the common icons up front so the first preview doesn't stall
+    _resolve_icon("", True)
+    _resolve_icon("", False)
+    for ext in _EXT_TO_CATEGORY:
+        _resolve_icon(ext, False)
 
 # ────────── data model utilities ─────────────────────────────────────
 @dataclass(slots=True)
 class RenameOp:
     src: Path
     tgt: Path
-
-    @property
-    def size(self) -> int:
-        try:
-            return self.src.stat().st_size if self.src.is_file() else 0
-        except OSError:
-            return 0
-
-    @property
-    def mtime(self) -> float:
-        try:
-            return self.src.stat().st_mtime
-        except OSError:
-            return 0.0
+    st: os.stat_result | None = None     # pass a known stat to skip the syscall
+    is_dir: bool  = field(init=False, default=False)
+    size: int     = field(init=False, default=0)
+    mtime: float  = field(init=False, default=0.0)
+    # display strings, formatted once instead of on every repaint
+    type_str: str  = field(init=False, default="")
+    size_str: str  = field(init=False, default="")
+    mtime_str: str = field(init=False, default="")
+    search_key: str = field(init=False, default="")   # lower-cased "old\0new" for the filter
+    icon: QIcon | None = field(init=False, default=None)   # set on the GUI thread
+
+    def __post_init__(self):
+        # one stat per op – the table reads these on every repaint
+        if self.st is None:
+            try:
+                self.st = self.src.stat()
+            except OSError:
+                pass
+        if self.st is not None:
+            mode = self.st.st_mode
+            self.is_dir = stat.S_ISDIR(mode)
+            self.size   = self.st.st_size if stat.S_ISREG(mode) else 0
+            self.mtime  = self.st.st_mtime
+        self.type_str  = "Dir" if self.is_dir else self.src.suffix.lstrip(".") or "file"
+        self.size_str  = human_readable_size(self.size) if self.size else ""
+        self.mtime_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.mtime))
+        self.search_key = f"{self.src.name}\0{self.tgt.name}".lower()
 
 def _windows_fix(name: str) -> str:
     base, *ext = name.split('.')
@@ -169,28 +239,92 @@ def _windows_fix(name: str) -> str:
     base = base.rstrip(' .')
     return base + ('.' + '.'.join(ext) if ext else '')
 
-def sanitise(name: str, bad: Set[str], repl: str | None) -> str:
-    txt = ''.join(repl if c in bad else c for c in name) if repl else ''.join(c for c in name if c not in bad)
-    txt = re.sub(r'[ \t]+', '_', txt.strip())
-    txt = re.sub(r'_+', '_', txt)
+@lru_cache(maxsize=32)
+def _trans_table(bad: FrozenSet[str], repl: str | None) -> Dict[int, str | None]:
+    # str.translate fills a 128-entry lookup table from this for ASCII names
+    return dict.fromkeys(map(ord, bad), repl)
+
+def sanitise(name: str, bad: AbstractSet[str], repl: str | None) -> str:
+    # frozenset() of a frozenset is free, so callers should pass one
+    txt = name.translate(_trans_table(frozenset(bad), repl or None))
+    txt = _COLLAPSE_RE.sub('_', txt.strip())
     return _windows_fix(txt) or '_'
 
-def _targets(root: Path, rec: bool, files: bool, dirs: bool):
-    it = root.rglob('*') if rec else root.iterdir()
-    for p in sorted(it, key=lambda x: len(x.parts), reverse=True):
-        if p.is_file() and not files: continue
-        if p.is_dir() and not dirs: continue
-        yield p
+def _suffix(name: str) -> str:
+    # same rule as PurePath.suffix, without building a Path
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
 
-def _unique(tgt: Path, taken: set[Path]) -> Path:
-    if tgt not in taken and not tgt.exists():
-        taken.add(tgt)
+def _scan(path: str, top: bool) -> List[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except PermissionError:
+        if top: raise
+        return []
+
+def _walk(root: str, rec: bool) -> Iterator[os.DirEntry]:
+    """Yield everything below *root*, children before their folder; symlinked dirs are not followed."""
+    stack, pending = [iter(_scan(root, True))], [None]   # pending: folder to emit once drained
+    while stack:
+        for e in stack[-1]:
+            if rec and e.is_dir(follow_symlinks=False):
+                stack.append(iter(_scan(e.path, False)))
+                pending.append(e)
+                break
+            yield e
+        else:
+            stack.pop()
+            d = pending.pop()
+            if d is not None:
+                yield d
+
+def _targets(root: Path, rec: bool, files: bool, dirs: bool) -> Iterator[os.DirEntry]:
+    # post-order walk, so children are renamed before their parents
+    for e in _walk(os.fspath(root), rec):
+        if e.is_file() and not files: continue
+        if e.is_dir() and not dirs: continue
+        yield e
+
+def _entry_key(e: os.DirEntry):
+    # same order as sorting Path objects: per part, case-folded on Windows
+    return os.path.normcase(e.path).split(os.sep)
+
+def _dir_key(p: str) -> str:
+    return os.path.normcase(os.path.normpath(p))
+
+def _make_op(e: os.DirEntry, src: Path, new: str,
+             taken: set[Path], existing: Dict[Path, Set[str]]) -> RenameOp:
+    try:
+        st = e.stat()
+    except OSError:
+        st = None
+    return RenameOp(src, _unique(src.with_name(new), taken, existing), st)
+
+def _dir_names(parent: Path, existing: Dict[Path, Set[str]]) -> Set[str]:
+    # one scandir per parent instead of one exists() per candidate; names are
+    # casefolded everywhere – the filesystem may be case-insensitive on any OS
+    # (macOS default, Windows), and a false clash only costs a _N suffix
+    names = existing.get(parent)
+    if names is None:
+        try:
+            with os.scandir(parent) as it:
+                names = {e.name.casefold() for e in it}
+        except OSError:
+            names = set()
+        existing[parent] = names
+    return names
+
+def _unique(tgt: Path, taken: set[Path], existing: Dict[Path, Set[str]]) -> Path:
+    names = _dir_names(tgt.parent, existing)
+    if tgt not in taken and tgt.name.casefold() not in names:
+        taken.add(tgt); names.add(tgt.name.casefold())
         return tgt
     stem, suf, i = tgt.stem, tgt.suffix, 1
     while i < 10000:
         cand = tgt.with_name(f"{stem}_{i}{suf}")
-        if cand not in taken and not cand.exists():
-            taken.add(cand)
+        if cand not in taken and cand.name.casefold() not in names:
+            taken.add(cand); names.add(cand.name.casefold())
             return cand
         i += 1
     raise RuntimeError("Could not generate unique name")
@@ -201,6 +335,16 @@ def _safe_move(src: Path, dst: Path):
     except OSError:
         shutil.move(str(src), str(dst))
 
+# undo log: u32 count, then a length-prefixed UTF-8 src and tgt per op
+def _write_blob(fh, p: Path):
+    b = str(p).encode("utf-8", "surrogateescape")
+    fh.write(struct.pack("<I", len(b)))
+    fh.write(b)
+
+def _read_blob(fh) -> Path:
+    (n,) = struct.unpack("<I", fh.read(4))
+    return Path(fh.read(n).decode("utf-8", "surrogateescape"))
+
 # ────────── human-readable size helper ───────────────────────────────
 def human_readable_size(num_bytes: int) -> str:
     """
@@ -214,93 +358,185 @@ def human_readable_size(num_bytes: int) -> str:
     return f"{num_bytes:.1f} PB"
 
 # ────────── photo datetime helper ────────────────────────────────────
-def _photo_dt(p: Path) -> datetime | None:
-    if Image and p.suffix.lower() in PHOTO_EXTS:
+EXIF_DT_TAGS   = (0x9003, 0x0132)   # DateTimeOriginal, DateTime
+JPEG_EXTS      = {".jpg", ".jpeg"}
+EXIF_SCAN_SIZE = 64 * 1024          # APP1/Exif sits at the start of a JPEG
+
+def _parse_exif_dt(s) -> datetime | None:
+    # fixed "YYYY:MM:DD HH:MM:SS" layout – far cheaper than strptime
+    if not isinstance(s, str) or len(s) < 19:
+        return None
+    try:
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                        int(s[11:13]), int(s[14:16]), int(s[17:19]))
+    except ValueError:
+        return None
+
+def _jpeg_has_exif(path: str) -> bool:
+    try:
+        with open(path, "rb") as fh:
+            return b"Exif\x00\x00" in fh.read(EXIF_SCAN_SIZE)
+    except OSError:
+        return False
+
+@lru_cache(maxsize=4096)
+def _photo_dt(path: str, mtime: float) -> datetime | None:
+    """EXIF capture time, else *mtime*; keyed on mtime so edited files are re-read."""
+    suf = _suffix(os.path.basename(path)).lower()
+    # JPEGs without an Exif segment skip PIL entirely
+    if Image and suf in PHOTO_EXTS and (suf not in JPEG_EXTS or _jpeg_has_exif(path)):
         try:
-            exif = Image.open(p).getexif()
-            dt   = exif.get(0x9003) or exif.get(0x0132)
+            with Image.open(path) as im:
+                exif = im.getexif()
+            dt = _parse_exif_dt(exif.get(EXIF_DT_TAGS[0]) or exif.get(EXIF_DT_TAGS[1]))
             if dt:
-                return datetime.strptime(dt, "%Y:%m:%d %H:%M:%S")
+                return dt
         except Exception:
             pass
     try:
-        return datetime.fromtimestamp(p.stat().st_mtime)
+        return datetime.fromtimestamp(mtime)
     except Exception:
         return None
 
 # ────────── rename generators ─────────────────────────────────────────
-def generate_standard(root, rec, pf, pd, bad, repl, exts):
-    taken, ops = set(), []
-    for src in _targets(root, rec, pf, pd):
-        if src.is_file() and exts and src.suffix.lower() not in exts: continue
-        new = sanitise(src.name, bad, repl)
-        if new == src.name or (os.name=="nt" and new.lower()==src.name.lower()): continue
-        ops.append(RenameOp(src, _unique(src.with_name(new), taken)))
+@lru_cache(maxsize=64)
+def _compile_rx(pattern: str) -> re.Pattern:
+    # survives across preview / auto-watch cycles with the same pattern
+    return re.compile(pattern)
+
+def _emit_ops(entries, exts, new_name) -> List[RenameOp]:
+    """Shared generator loop; *new_name(entry)* returns the target name or None to skip."""
+    taken, ops, existing = set(), [], {}
+    append, suffix, make_op = ops.append, _suffix, _make_op   # locals for the hot loop
+    for e in entries:
+        if exts and e.is_file() and suffix(e.name).lower() not in exts: continue
+        new = new_name(e)
+        if new is None: continue
+        append(make_op(e, Path(e.path), new, taken, existing))
     return ops
 
+def generate_standard(root, rec, pf, pd, bad, repl, exts):
+    bad, nt = frozenset(bad), os.name == "nt"
+    def new_name(e):
+        name = e.name
+        new = sanitise(name, bad, repl)
+        if new == name or (nt and new.lower() == name.lower()): return None
+        return new
+    return _emit_ops(_targets(root, rec, pf, pd), exts, new_name)
+
 def generate_sequential(root, rec, pf, pd, pre, start, exts):
-    taken, ops, n = set(), [], start
-    for src in sorted(_targets(root, rec, pf, pd)):
-        if src.is_file() and exts and src.suffix.lower() not in exts: continue
-        suf = src.suffix if src.is_file() else ""
-        ops.append(RenameOp(src, _unique(src.with_name(f"{pre}{n}{suf}"), taken)))
+    n = start
+    def new_name(e):
+        nonlocal n
+        suf = _suffix(e.name) if e.is_file() else ""
         n += 1
-    return ops
+        return f"{pre}{n - 1}{suf}"
+    return _emit_ops(sorted(_targets(root, rec, pf, pd), key=_entry_key), exts, new_name)
 
 def generate_regex(root, rec, pf, pd, pattern, repl, exts):
-    rx = re.compile(pattern)
-    taken, ops = set(), []
-    for src in _targets(root, rec, pf, pd):
-        if src.is_file() and exts and src.suffix.lower() not in exts: continue
-        new = rx.sub(repl, src.name)
-        if new == src.name: continue
-        ops.append(RenameOp(src, _unique(src.with_name(new), taken)))
-    return ops
+    sub = _compile_rx(pattern).sub
+    def new_name(e):
+        name = e.name
+        new = sub(repl, name)
+        return None if new == name else new
+    return _emit_ops(_targets(root, rec, pf, pd), exts, new_name)
 
 def generate_metadata(root, rec, pf, pd, prefix, exts):
     if Image is None:
         raise RuntimeError("Metadata mode requires Pillow – pip install pillow")
-    taken, ops = set(), []
-    for src in sorted(_targets(root, rec, pf, pd)):
-        if src.is_dir() or src.suffix.lower() not in PHOTO_EXTS: continue
-        dt = _photo_dt(src)
-        if not dt: continue
-        ts = dt.strftime("%Y-%m-%d_%H-%M-%S")
-        ops.append(RenameOp(src, _unique(src.with_name(f"{prefix}{ts}{src.suffix.lower()}"), taken)))
-    return ops
+    def new_name(e):
+        suf = _suffix(e.name).lower()
+        if suf not in PHOTO_EXTS or e.is_dir(): return None
+        try:
+            dt = _photo_dt(e.path, e.stat().st_mtime)
+        except OSError:
+            return None
+        if not dt: return None
+        return f"{prefix}{dt.strftime('%Y-%m-%d_%H-%M-%S')}{suf}"
+    # the extension filter never applied to metadata mode
+    return _emit_ops(sorted(_targets(root, rec, pf, pd), key=_entry_key), None, new_name)
 
 # ────────── threaded workers ──────────────────────────────────────────
-class PreviewWorker(QThread):
-    finished = Signal(list, str)
-    def __init__(self, mode: str, params: Tuple):
+class WorkerSignals(QObject):
+    """Lives on the GUI thread; pooled workers emit through it."""
+    preview_done = Signal(int, list, str, list)   # generation, ops, error, new folders to watch
+    progress     = Signal(int)             # items done; the bar's range is set up front
+    rename_done  = Signal(bool, str)
+    watch_dirs   = Signal(int, list)       # generation, folders below the watched root
+
+class PreviewWorker(QRunnable):
+    def __init__(self, signals: WorkerSignals, gen: int, mode: str, params: Tuple,
+                 roots: List[str] | None = None, watched: AbstractSet[str] = frozenset()):
         super().__init__()
-        self.mode, self.params = mode, params
+        self.signals, self.gen = signals, gen
+        self.mode, self.params, self.roots, self.watched = mode, params, roots, watched
     def run(self):
         try:
-            ops = (generate_standard  if self.mode=="std" else
-                   generate_sequential if self.mode=="seq" else
-                   generate_regex      if self.mode=="rex" else
-                   generate_metadata)(*self.params)
-            self.finished.emit(ops, "")
+            generate = (generate_standard  if self.mode=="std" else
+                        generate_sequential if self.mode=="seq" else
+                        generate_regex      if self.mode=="rex" else
+                        generate_metadata)
+            new_dirs: List[str] = []
+            if self.roots is None:
+                ops = generate(*self.params)
+            else:
+                # watch mode: rescan only the changed folders, non-recursively,
+                # deepest first so children still go before their parents
+                ops, rec = [], self.params[1]
+                for d in sorted(self.roots, key=lambda s: s.count(os.sep), reverse=True):
+                    if not os.path.isdir(d):
+                        continue
+                    if rec:
+                        # a folder that isn't watched yet arrived with its contents
+                        # (unzip, checkout): take it whole and watch everything in it
+                        for e in _scan(d, False):
+                            if e.is_dir(follow_symlinks=False) and _dir_key(e.path) not in self.watched:
+                                new_dirs.append(e.path)
+                                new_dirs += [s.path for s in _walk(e.path, True)
+                                             if s.is_dir(follow_symlinks=False)]
+                                ops += generate(Path(e.path), True, *self.params[2:])
+                    ops += generate(Path(d), False, *self.params[2:])
+            self.signals.preview_done.emit(self.gen, ops, "", new_dirs)
         except Exception as ex:
-            self.finished.emit([], str(ex))
+            self.signals.preview_done.emit(self.gen, [], str(ex), [])
 
-class RenameWorker(QThread):
-    progress = Signal(int, int)
-    finished = Signal(bool, str)
-    def __init__(self, ops: List[RenameOp]):
+class WatchScanWorker(QRunnable):
+    """Collects every folder below *root* for the watcher, off the GUI thread."""
+    def __init__(self, signals: WorkerSignals, gen: int, root: str):
         super().__init__()
-        self.ops = ops
+        self.signals, self.gen, self.root = signals, gen, root
+    def run(self):
+        try:
+            dirs = [e.path for e in _walk(self.root, True) if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            dirs = []
+        self.signals.watch_dirs.emit(self.gen, dirs)
+
+class RenameWorker(QRunnable):
+    def __init__(self, signals: WorkerSignals, ops: List[RenameOp]):
+        super().__init__()
+        self.signals, self.ops = signals, ops
     def run(self):
+        n, last_emit = len(self.ops), time.monotonic()
         try:
             for i, op in enumerate(self.ops, 1):
-                tmp = op.src.with_name(f".{op.src.name}.swap_tmp")
-                _safe_move(op.src, tmp)
-                _safe_move(tmp, op.tgt)
-                self.progress.emit(i, len(self.ops))
-            self.finished.emit(True, "Renaming complete.")
+                src, tgt = op.src, op.tgt
+                # only a case-only change on Windows needs the temp hop
+                if (os.name == "nt" and src.parent == tgt.parent
+                        and src.name != tgt.name and src.name.lower() == tgt.name.lower()):
+                    tmp = src.with_name(f".{src.name}.swap_tmp")
+                    _safe_move(src, tmp)
+                    _safe_move(tmp, tgt)
+                else:
+                    _safe_move(src, tgt)
+                # cap cross-thread progress updates at roughly the display rate
+                now = time.monotonic()
+                if now - last_emit > 0.016 or i == n:
+                    self.signals.progress.emit(i)
+                    last_emit = now
+            self.signals.rename_done.emit(True, "Renaming complete.")
         except Exception as ex:
-            self.finished.emit(False, str(ex))
+            self.signals.rename_done.emit(False, str(ex))
 
 # ────────── proxy & model ────────────────────────────────────────────
 class FastFilterProxy(QSortFilterProxyModel):
@@ -311,12 +547,7 @@ class FastFilterProxy(QSortFilterProxyModel):
         self._needle = t.lower()
         self.invalidateFilter()
     def filterAcceptsRow(self, row, parent):
-        if not self._needle: return True
-        sm = self.sourceModel()
-        for col in (1, 2):
-            val = sm.data(sm.index(row, col, parent), Qt.DisplayRole)
-            if val and self._needle in str(val).lower(): return True
-        return False
+        return not self._needle or self._needle in self.sourceModel().row_text(row)
 
 class RenameModel(QAbstractTableModel):
     headers = ("", "Original", "New name", "Type", "Size", "Modified")
@@ -325,17 +556,18 @@ class RenameModel(QAbstractTableModel):
         self.ops: List[RenameOp] = []
     def rowCount(self, *_): return len(self.ops)
     def columnCount(self, *_): return 6
+    def row_text(self, row: int) -> str: return self.ops[row].search_key
     def data(self, idx: QModelIndex, role=Qt.DisplayRole):
         if not idx.isValid(): return None
         op, col = self.ops[idx.row()], idx.column()
         if role == Qt.DecorationRole and col == 0:
-            return _icon_for_path(op.src)
+            return op.icon
         if role == Qt.DisplayRole:
             if col == 1: return op.src.name
             if col == 2: return op.tgt.name
-            if col == 3: return "Dir" if op.src.is_dir() else op.src.suffix.lstrip(".") or "file"
-            if col == 4: return human_readable_size(op.size) if op.size else ""
-            if col == 5: return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(op.mtime))
+            if col == 3: return op.type_str
+            if col == 4: return op.size_str
+            if col == 5: return op.mtime_str
         if role == Qt.TextAlignmentRole and col in (4, 5):
             return Qt.AlignRight | Qt.AlignVCenter
         if role == Qt.ToolTipRole and col == 1:
@@ -344,14 +576,155 @@ class RenameModel(QAbstractTableModel):
     def headerData(self, s, o, r):
         return self.headers[s] if o==Qt.Horizontal and r==Qt.DisplayRole else super().headerData(s,o,r)
     def set_ops(self, ops: List[RenameOp]):
+        for op in ops:
+            op.icon = _resolve_icon("" if op.is_dir else _suffix(op.src.name)[1:].lower(), op.is_dir)
         self.beginResetModel()
         self.ops = ops
         self.endResetModel()
+    def clear(self):
+        if not self.ops: return
+        self.beginRemoveRows(QModelIndex(), 0, len(self.ops) - 1)
+        self.ops = []   # rebind, don't clear(): the old list lives on as the undo batch
+        self.endRemoveRows()
+
+# ────────── theme ─────────────────────────────────────────────────────
+_ACCENT = QColor("#2080ff")
+
+@lru_cache(maxsize=2)
+def _theme_palette(dark: bool) -> QPalette:
+    # built lazily: QPalette() picks up the application palette, so it needs a QApplication
+    pal = QPalette()
+    if dark:
+        pal.setColor(QPalette.Window, QColor(37, 37, 43))
+        pal.setColor(QPalette.Base, QColor(27, 27, 33))
+        pal.setColor(QPalette.AlternateBase, QColor(47, 47, 55))
+        pal.setColor(QPalette.Text, Qt.white)
+        pal.setColor(QPalette.Button, QColor(55, 55, 65))
+        pal.setColor(QPalette.ButtonText, Qt.white)
+        pal.setColor(QPalette.Highlight, _ACCENT)
+        pal.setColor(QPalette.HighlightedText, Qt.white)
+        pal.setColor(QPalette.WindowText, Qt.white)
+    return pal
+
+_CHECK_URI = CHECK_PNG.as_posix()
+_CSS_TEMPLATE = string.Template("""
+QPushButton {
+    background:$accent; color:#fff; border:none;
+    padding:5px 10px; border-radius:4px;
+}
+QPushButton:hover  { background:$accent_hi; }
+QPushButton:pressed{ background:$accent_lo; }
+QPushButton:disabled{ background:#555; color:#888; }
+
+QListView::indicator {
+    width:14px; height:14px; border:1px solid $accent;
+}
+QListView::indicator:checked {
+    background:$accent;
+    image:url("$check");
+}
+QListView::indicator:unchecked { background:transparent; }
+
+QLineEdit:disabled, QSpinBox:disabled, QListWidget:disabled {
+    color:#888; background:#333;
+}
+QHeaderView::section {
+    background:#404048;  /* header contrast */
+}
+QRadioButton:disabled, QCheckBox:disabled { color:#888; }
+""")
+_CSS_CACHE: Dict[int, str] = {}
+
+def _theme_css(accent: QColor) -> str:
+    key = accent.rgb()
+    css = _CSS_CACHE.get(key)
+    if css is None:
+        css = _CSS_CACHE[key] = _CSS_TEMPLATE.substitute(
+            accent=accent.name(),
+            accent_hi=accent.lighter(110).name(),
+            accent_lo=accent.darker(120).name(),
+            check=_CHECK_URI,
+        )
+    return css
+
+# ────────── settings cache ──────────────────────────────────────────────
+class CachedSettings:
+    """
+    In-memory front for QSettings: every key is read once up front, and
+    flush() writes back only the keys whose value actually changed.
+    """
+    def __init__(self, st: QSettings):
+        self._st = st
+        self._cache = {k: st.value(k) for k in st.allKeys()}
+        self._dirty: Set[str] = set()
+        self._removed: Set[str] = set()
+
+    @staticmethod
+    def _coerce(v, typ):
+        if typ is bool and isinstance(v, str):
+            return v.lower() == "true"      # INI stores bools as text
+        return typ(v)
+
+    def value(self, key: str, default=None, typ=None):
+        if key not in self._cache:
+            return default
+        v = self._cache[key]
+        if typ is None:
+            return v
+        try:
+            return self._coerce(v, typ)
+        except (TypeError, ValueError):
+            return default
+
+    def setValue(self, key: str, value):
+        if key in self._cache and self.value(key, None, type(value)) == value:
+            return   # unchanged – nothing to write back
+        self._cache[key] = value
+        self._dirty.add(key)
+        self._removed.discard(key)
+
+    def remove(self, key: str):
+        if self._cache.pop(key, None) is not None:
+            self._dirty.discard(key)
+            self._removed.add(key)
+
+    # QSettings array layout: prefix/size, prefix/1/field … prefix/N/field
+    def read_array(self, prefix: str, **fields) -> List[tuple]:
+        n = self.value(f"{prefix}/size", 0, int)
+        return [tuple(self.value(f"{prefix}/{i}/{name}", None, typ) for name, typ in fields.items())
+                for i in range(1, n + 1)]
+
+    def write_array(self, prefix: str, rows, *fields: str):
+        keep = {f"{prefix}/size"}
+        self.setValue(f"{prefix}/size", len(rows))
+        for i, row in enumerate(rows, 1):
+            for name, v in zip(fields, row):
+                key = f"{prefix}/{i}/{name}"
+                keep.add(key)
+                self.setValue(key, v)
+        for k in [k for k in self._cache if k.startswith(prefix + "/") and k not in keep]:
+            self.remove(k)   # rows left over from a longer array
+
+    def flush(self):
+        for k in self._removed:
+            self._st.remove(k)
+            # QSettings.remove() takes sub-keys along – re-write the ones still cached
+            self._dirty.update(c for c in self._cache if c.startswith(k + "/"))
+        self._removed.clear()
+        for k in self._dirty:
+            self._st.setValue(k, self._cache[k])
+        self._dirty.clear()
+        self._st.sync()
+
+# pre-array ext_items: a JSON list of [ext, checked] pairs
+def _read_legacy_ext_json(raw: str) -> Tuple[Tuple[str, bool], ...]:
+    return tuple((str(t), bool(c)) for t, c in _jloads(raw))
 
 # ────────── settings dialog ─────────────────────────────────────────────
 class SettingsDialog(QDialog):
-    def __init__(self, st: QSettings, parent=None):
+    def __init__(self, st: CachedSettings, parent=None):
         super().__init__(parent)
+        self._st = st
         self.setWindowTitle("Preferences")
         self.setMinimumWidth(260)
         v = QVBoxLayout(self)
@@ -371,7 +744,7 @@ class SettingsDialog(QDialog):
         self.cb_rec.setChecked(st.value("default_recursive", False, bool))
 
     def accept(self):
-        st = QSettings()
+        st = self._st
         st.setValue("remember_last", self.cb_rem.isChecked())
         st.setValue("dark_theme", self.cb_dark.isChecked())
         st.setValue("default_recursive", self.cb_rec.isChecked())
@@ -381,31 +754,52 @@ class SettingsDialog(QDialog):
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        self._app = QApplication.instance()
         QApplication.setOrganizationName(ORG_NAME)
         QApplication.setApplicationName(APP_NAME)
         cfg = Path(QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)) / "clean_names.ini"
         cfg.parent.mkdir(parents=True, exist_ok=True)
-        self.sts = QSettings(str(cfg), QSettings.IniFormat)
+        self.sts = CachedSettings(QSettings(str(cfg), QSettings.IniFormat))
 
         self.setWindowTitle(f"Clean Names {VERSION}")
-        if LOGO_PNG.exists():
-            self.setWindowIcon(QIcon(str(LOGO_PNG)))
+        if _logo_icon():
+            self.setWindowIcon(_logo_icon())
 
         self.ops: List[RenameOp] = []
         self.undo: List[RenameOp] = []
-        self.preview_worker: PreviewWorker | None = None
-        self.rename_worker: RenameWorker | None = None
+        # workers run on the global pool; results from superseded previews are dropped
+        self.pool = QThreadPool.globalInstance()
+        self.signals = WorkerSignals(self)
+        self.signals.preview_done.connect(self._preview_finished)
+        self.signals.progress.connect(lambda i: self.pg.setValue(i))
+        self.signals.rename_done.connect(self._rename_finished)
+        self._preview_gen = 0
+        self._preview_from_watch = False
+        self._preview_running = False
+        self._rename_running = False
         self.last_mode = "std"
         self.last_params: Tuple = ()
 
+        # change bursts are coalesced into a dirty set and handled at most once a second
         self.watcher = QFileSystemWatcher()
-        self._watch_timer = QTimer(singleShot=True, interval=500)
-        self._watch_timer.timeout.connect(lambda: self._auto_rename(confirm=True))
-        self.watcher.directoryChanged.connect(lambda *_: self._watch_timer.start())
+        # mirrors the watcher (_dir_key -> path as handed to Qt), skips the Qt round-trip when empty
+        self._watched_paths: Dict[str, str] = {}
+        self._dirty_dirs: Set[str] = set()
+        self._watch_gen = 0
+        self._echo_dirs: FrozenSet[str] = frozenset()   # folders the running rename touches
+        self._echo_hits: Set[str] = set()
+        self._watch_confirm = True
+        self._watch_scanning = False   # subfolder scan in flight: hold dirty-dir handling
+        self.signals.watch_dirs.connect(self._watch_scan_done)
+        self._watch_timer = QTimer(interval=1000)
+        self._watch_timer.timeout.connect(self._watch_tick)
+        self.watcher.directoryChanged.connect(self._watch_changed)
 
         self._build_ui()
         self._restore_splitter()
+        QApplication.setStyle("Fusion")   # once; re-setting it re-polishes every widget
         self._apply_theme(self.sts.value("dark_theme", True, bool))
+        _warm_icon_cache()
 
     def _build_ui(self):
         # Left panel
@@ -427,6 +821,8 @@ class MainWindow(QMainWindow):
         self.cb_watch = QCheckBox("Watch folder & auto-rename")
         for w in (self.cb_rec, self.cb_files, self.cb_dirs, self.cb_watch):
             lv.addWidget(w)
+        self.cb_watch.toggled.connect(self._update_watcher)
+        self.cb_rec.toggled.connect(self._update_watcher)
 
         lv.addSpacing(12)
         lv.addWidget(QLabel("Mode:"))
@@ -503,7 +899,7 @@ class MainWindow(QMainWindow):
         self.tbl = QTableView()
         self.tbl.setModel(self.proxy)
         self.tbl.setSortingEnabled(True)
-        self.tbl.setIconSize(QSize(16, 16))
+        self.tbl.setIconSize(QSize(ICON_PX, ICON_PX))
 
         hdr = self.tbl.horizontalHeader()
         hdr.setSectionResizeMode(QHeaderView.Interactive)
@@ -555,7 +951,7 @@ class MainWindow(QMainWindow):
                 self.le_add_ext.clear()
                 return
         it = QListWidgetItem(t)
-        it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
+        it.setFlags(_EXT_ITEM_FLAGS)
         it.setCheckState(Qt.Checked)
         self.lst_ext.addItem(it)
         self.le_add_ext.clear()
@@ -565,19 +961,14 @@ class MainWindow(QMainWindow):
         if p:
             self.le_dir.setText(p)
             self.sts.setValue("last_folder", p)
-            # guard removePaths
-            dirs = self.watcher.directories()
-            if dirs:
-                self.watcher.removePaths(dirs)
-            if self.cb_watch.isChecked():
-                self.watcher.addPath(p)
+            self._update_watcher()
 
     def _open_settings(self):
         dlg = SettingsDialog(self.sts, self)
         if dlg.exec():
             self._apply_theme(self.sts.value("dark_theme", True, bool))
 
-    def _start_preview(self, from_watch=False):
+    def _start_preview(self, from_watch=False, roots: List[str] | None = None):
         if not self.le_dir.text():
             QMessageBox.warning(self, "No folder", "Choose a target folder first.")
             return
@@ -590,7 +981,7 @@ class MainWindow(QMainWindow):
         exts = self._sel_ext()
         mode_id = self.bg_mode.checkedId()
         if mode_id == 0:
-            bad = set(self.le_bad.text()) or DEFAULT_BAD_CHARS
+            bad = frozenset(self.le_bad.text()) or DEFAULT_BAD_CHARS
             repl = self.le_rep.text() or None
             if repl and len(repl) != 1:
                 self._busy_done()
@@ -605,20 +996,27 @@ class MainWindow(QMainWindow):
             mode, params = "meta", (root, rec, f_ok, d_ok, self.le_meta_pre.text(), exts)
 
         self.last_mode, self.last_params = mode, params
-        self.preview_worker = PreviewWorker(mode, params)
-        self.preview_worker.finished.connect(lambda ops, err: self._preview_finished(ops, err, from_watch))
-        self.preview_worker.start()
-
-    def _preview_finished(self, ops: List[RenameOp], err: str, from_watch: bool = False):
+        self._preview_gen += 1
+        self._preview_from_watch, self._preview_running = from_watch, True
+        watched = frozenset(self._watched_paths) if roots is not None else frozenset()   # keys
+        self.pool.start(PreviewWorker(self.signals, self._preview_gen, mode, params, roots, watched))
+
+    def _preview_finished(self, gen: int, ops: List[RenameOp], err: str, new_dirs: List[str]):
+        if gen != self._preview_gen:
+            return   # a newer preview has already been started
+        self._preview_running = False
+        from_watch = self._preview_from_watch
         self._busy_done()
         if err:
             if not from_watch:
                 QMessageBox.critical(self, "Error", err)
             return
         if from_watch:
-            self.ops = ops
-            if ops:
-                self._auto_rename(confirm=False)
+            if new_dirs:
+                self._watch_add(new_dirs)   # before the rename, so renamed ones are followed
+            if ops and self._confirm_auto_rename(len(ops)):
+                self.ops = ops
+                self._start_rename()
             return
         self.ops = ops
         self.model.set_ops(ops)
@@ -638,28 +1036,46 @@ class MainWindow(QMainWindow):
         if QMessageBox.question(self, "Confirm", f"Proceed with renaming {len(self.ops)} item(s)?",
                                 QMessageBox.Yes | QMessageBox.No) != QMessageBox.Yes:
             return
+        self._start_rename()
+
+    def _start_rename(self):
         self.pg.setRange(0, len(self.ops)); self.pg.setValue(0); self.pg.setVisible(True)
-        self.rename_worker = RenameWorker(self.ops)
-        self.rename_worker.progress.connect(lambda i, _: self.pg.setValue(i))
-        self.rename_worker.finished.connect(self._rename_finished)
-        self.rename_worker.start()
+        self._rename_running = True
+        # the watcher reports our own renames back: hold those folders until we're done
+        self._echo_dirs = frozenset({_dir_key(o.src.parent) for o in self.ops} |
+                                    {_dir_key(o.src) for o in self.ops if o.is_dir})
+        self._echo_hits.clear()
+        self.pool.start(RenameWorker(self.signals, self.ops))
 
     def _rename_finished(self, ok: bool, msg: str):
+        self._rename_running = False
         self.pg.setVisible(False)
         if ok:
             self._log_undo_batch(self.ops)
-            self.undo = self.ops.copy()
-            self.ops.clear()
-            self.model.set_ops([])
+            self.undo, self.ops = self.ops, []
+            self.model.clear()
             self.statusBar().showMessage(msg, 3000)
+            moved = self._watch_after_rename(self.undo)
         else:
+            moved = {}
             QMessageBox.critical(self, "Rename failed", msg)
+        # held folders are rescanned once: anything else that changed there meanwhile isn't lost
+        for k in self._echo_hits:
+            p = moved.get(k) or self._watched_paths.get(k)
+            if p:
+                self._dirty_dirs.add(p)
+        self._echo_dirs, self._echo_hits = frozenset(), set()
 
     def _log_undo_batch(self, ops: List[RenameOp]):
-        path = Path(QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)) / "last_batch.json"
+        path = Path(QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)) / UNDO_LOG
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps([[str(o.src), str(o.tgt)] for o in ops]), encoding="utf-8")
+            with path.open("wb") as fh:
+                fh.write(struct.pack("<I", len(ops)))
+                for o in ops:
+                    _write_blob(fh, o.src)
+                    _write_blob(fh, o.tgt)
+            path.with_name(UNDO_LOG_JSON).unlink(missing_ok=True)   # superseded by this batch
         except Exception:
             pass
 
@@ -679,32 +1095,122 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, "Undo", "Undo complete." if not errs else "\n".join(errs))
 
     def _load_persisted_undo(self) -> bool:
-        path = Path(QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)) / "last_batch.json"
-        if not path.exists():
-            return False
+        cfg = Path(QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation))
+        path, old = cfg / UNDO_LOG, cfg / UNDO_LOG_JSON
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            self.undo = [RenameOp(Path(tgt), Path(src)) for src, tgt in data]
-            path.unlink()
+            if path.exists():
+                with path.open("rb") as fh:
+                    (n,) = struct.unpack("<I", fh.read(4))
+                    self.undo = [RenameOp(_read_blob(fh), _read_blob(fh)) for _ in range(n)]
+                path.unlink()
+            elif old.exists():
+                self.undo = [RenameOp(Path(src), Path(tgt))
+                             for src, tgt in _jloads(old.read_text(encoding="utf-8"))]
+                old.unlink()
+            else:
+                return False
             return True
         except Exception:
             return False
 
+    def _watch_add(self, paths: List[str]):
+        failed = set(self.watcher.addPaths(paths))
+        self._watched_paths.update((_dir_key(p), p) for p in paths if p not in failed)
+
+    def _watch_clear(self):
+        if self._watched_paths:
+            self.watcher.removePaths(list(self._watched_paths.values()))
+            self._watched_paths.clear()
+
+    def _watch_remove(self, keys: List[str]):
+        self.watcher.removePaths([self._watched_paths.pop(k) for k in keys])
+
     def _update_watcher(self):
-        dirs = self.watcher.directories()
+        # only the difference to what's already watched is applied
+        self._watch_gen += 1   # drops a subfolder scan still in flight
+        self._watch_scanning = False
+        root = self.le_dir.text()
+        if not (self.cb_watch.isChecked() and root):
+            self._watch_clear()
+            self._dirty_dirs.clear()
+            self._watch_timer.stop()
+            return
+        rk = _dir_key(root)
+        if rk not in self._watched_paths:   # new target folder: start over
+            self._watch_clear()
+            self._dirty_dirs.clear()
+            self._watch_add([root])
+        # each folder is watched on its own, so a change only rescans that folder
+        if not self.cb_rec.isChecked():
+            stale = [k for k in self._watched_paths if k != rk]
+            if stale:
+                self._watch_remove(stale)
+        elif len(self._watched_paths) == 1:
+            self._watch_scanning = True
+            self.pool.start(WatchScanWorker(self.signals, self._watch_gen, root))
+        self._watch_timer.start()
+
+    def _watch_scan_done(self, gen: int, dirs: List[str]):
+        if gen != self._watch_gen:
+            return   # root or Recursive changed meanwhile
+        self._watch_scanning = False
         if dirs:
-            self.watcher.removePaths(dirs)
-        if self.cb_watch.isChecked() and self.le_dir.text():
-            self.watcher.addPath(self.le_dir.text())
-
-    def _auto_rename(self, confirm: bool = True):
-        if confirm and QMessageBox.question(self, "Auto-rename",
-                                            "Folder changed – apply last rules?",
-                                            QMessageBox.Yes | QMessageBox.No) != QMessageBox.Yes:
+            self._watch_add(dirs)
+
+    def _watch_after_rename(self, ops: List[RenameOp]) -> Dict[str, str]:
+        # re-watch renamed folders, and everything below them, under their new paths;
+        # ops run children first with parents' old names, so each src is an original path.
+        # Returns old key -> new path for every watched folder that moved.
+        watched = self._watched_paths
+        ren = {_dir_key(o.src): o.tgt.name for o in ops if o.is_dir}
+        if not ren.keys() & watched.keys():
+            return {}
+        final: Dict[str, str] = {}
+        def path_of(k: str) -> str:
+            p = final.get(k)
+            if p is None:
+                p, parent = watched[k], os.path.dirname(k)
+                if parent != k and parent in watched and path_of(parent) != watched[parent]:
+                    p = os.path.join(path_of(parent), os.path.basename(p))
+                if k in ren:
+                    p = os.path.join(os.path.dirname(p), ren[k])
+                final[k] = p
+            return p
+        moved = {k: path_of(k) for k in list(watched) if path_of(k) != watched[k]}
+        if moved:
+            self._watch_remove(list(moved))
+            self._watch_add(list(moved.values()))
+        return moved
+
+    def _watch_changed(self, path: str):
+        key = _dir_key(path)
+        if self._rename_running and key in self._echo_dirs:
+            self._echo_hits.add(key)   # most likely our own rename; looked at again once it's done
             return
-        self._start_preview(from_watch=True)
-        if confirm:
-            self.statusBar().showMessage("Auto-rename finished.", 3000)
+        self._dirty_dirs.add(path)
+
+    def _watch_tick(self):
+        if (self._preview_running or self._rename_running or self._watch_scanning
+                or not self._dirty_dirs):
+            return
+        dirs, self._dirty_dirs = self._dirty_dirs, set()
+        self._auto_rename(dirs=list(dirs))
+
+    def _auto_rename(self, dirs: List[str], confirm: bool = True):
+        # rescan first, ask only when there is something to rename
+        self._watch_confirm = confirm
+        self._start_preview(from_watch=True, roots=dirs)
+
+    def _confirm_auto_rename(self, n: int) -> bool:
+        if not self._watch_confirm:
+            return True
+        self._watch_timer.stop()   # no stacked prompts while the question box is open
+        ok = QMessageBox.question(self, "Auto-rename",
+                                  f"Folder changed – apply last rules to {n} item(s)?",
+                                  QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes
+        if self.cb_watch.isChecked():
+            self._watch_timer.start()
+        return ok
 
     def _apply_header_state(self):
         hdr = self.tbl.horizontalHeader()
@@ -731,58 +1237,22 @@ class MainWindow(QMainWindow):
         js = self.sts.value("splitter_sizes", "")
         try:
             if js:
-                self.splitter.setSizes(list(json.loads(js)))
+                self.splitter.setSizes(list(_jloads(js)))
                 return
         except Exception:
             pass
         self.splitter.setSizes([340, 860])
 
     def _save_splitter(self):
-        self.sts.setValue("splitter_sizes", json.dumps(self.splitter.sizes()))
+        self.sts.setValue("splitter_sizes", _jdumps(self.splitter.sizes()))
 
     def _apply_theme(self, dark: bool):
-        QApplication.setStyle("Fusion")
-        accent = QColor("#2080ff")
-        pal = QPalette()
-        if dark:
-            pal.setColor(QPalette.Window, QColor(37, 37, 43))
-            pal.setColor(QPalette.Base, QColor(27, 27, 33))
-            pal.setColor(QPalette.AlternateBase, QColor(47, 47, 55))
-            pal.setColor(QPalette.Text, Qt.white)
-            pal.setColor(QPalette.Button, QColor(55, 55, 65))
-            pal.setColor(QPalette.ButtonText, Qt.white)
-            pal.setColor(QPalette.Highlight, accent)
-            pal.setColor(QPalette.HighlightedText, Qt.white)
-            pal.setColor(QPalette.WindowText, Qt.white)
-        QApplication.setPalette(pal)
-
-        css = f"""
-        QPushButton {{
-            background:{accent.name()}; color:#fff; border:none;
-            padding:5px 10px; border-radius:4px;
-        }}
-        QPushButton:hover  {{ background:{accent.lighter(110).name()}; }}
-        QPushButton:pressed{{ background:{accent.darker(120).name()}; }}
-        QPushButton:disabled{{ background:#555; color:#888; }}
-
-        QListView::indicator {{
-            width:14px; height:14px; border:1px solid {accent.name()};
-        }}
-        QListView::indicator:checked {{
-            background:{accent.name()};
-            image:url("{CHECK_PNG.as_posix()}");
-        }}
-        QListView::indicator:unchecked {{ background:transparent; }}
-
-        QLineEdit:disabled, QSpinBox:disabled, QListWidget:disabled {{
-            color:#888; background:#333;
-        }}
-        QHeaderView::section {{
-            background:#404048;  /* header contrast */
-        }}
-        QRadioButton:disabled, QCheckBox:disabled {{ color:#888; }}
-        """
-        QApplication.instance().setStyleSheet(css)
+        app = self._app
+        app.setPalette(_theme_palette(dark))
+        # re-applying an identical sheet would still re-polish every widget
+        css = _theme_css(_ACCENT)
+        if app.styleSheet() != css:
+            app.setStyleSheet(css)
 
     def _load_settings(self):
         if self.sts.value("remember_last", True, bool):
@@ -790,30 +1260,38 @@ class MainWindow(QMainWindow):
         self.cb_rec.setChecked(self.sts.value("default_recursive", False, bool))
         self.le_filter.setText(self.sts.value("filter_text", ""))
 
-        self.lst_ext.clear()
-        try:
-            items = json.loads(self.sts.value("ext_items", "[]"))
-            for text, checked in items or [[e, False] for e in DEFAULT_EXTS]:
-                it = QListWidgetItem(text)
-                it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
-                it.setCheckState(Qt.Checked if checked else Qt.Unchecked)
-                self.lst_ext.addItem(it)
-        except Exception:
-            for e in DEFAULT_EXTS:
-                it = QListWidgetItem(e)
-                it.setFlags(it.flags() | Qt.ItemIsUserCheckable)
-                it.setCheckState(Qt.Unchecked)
-                self.lst_ext.addItem(it)
+        pairs = tuple((t, bool(c)) for t, c in self.sts.read_array("ext_items", t=str, c=bool) if t)
+        legacy = self.sts.value("ext_items", "", str)   # pre-array JSON form
+        if legacy and not pairs:
+            try:
+                pairs = _read_legacy_ext_json(legacy)
+            except Exception:
+                pairs = ()
+        pairs = pairs or _DEFAULT_EXT_PAYLOAD
+
+        # one addItems() call, then a single flag/check pass
+        lst = self.lst_ext
+        lst.setUpdatesEnabled(False); lst.blockSignals(True)
+        lst.clear()
+        lst.addItems([t for t, _ in pairs])
+        item = lst.item
+        for i, (_, checked) in enumerate(pairs):
+            it = item(i)
+            it.setFlags(_EXT_ITEM_FLAGS)
+            it.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+        lst.blockSignals(False); lst.setUpdatesEnabled(True)
+
+        # snapshot for closeEvent – unchanged values are not re-serialised
+        self._init_filter = self.le_filter.text()
+        self._init_ext_payload = None if legacy else pairs   # legacy key: migrate on close
 
         self.cb_watch.setChecked(False)
-        # guard removePaths
-        dirs = self.watcher.directories()
-        if dirs:
-            self.watcher.removePaths(dirs)
+        self._watch_clear()
 
     def _open_help(self):
-        if HELP_HTML.exists():
-            webbrowser.open(HELP_HTML.resolve().as_uri())
+        if HELP_URI:
+            import webbrowser   # only needed here; keeps it off the startup path
+            webbrowser.open(HELP_URI)
         else:
             QMessageBox.warning(self, "Help missing", str(HELP_HTML))
 
@@ -828,22 +1306,26 @@ class MainWindow(QMainWindow):
     def closeEvent(self, e):
         self._save_header_state()
         self._save_splitter()
-        self.sts.setValue("filter_text", self.le_filter.text())
-        items = [
-            [self.lst_ext.item(i).text(), self.lst_ext.item(i).checkState() == Qt.Checked]
-            for i in range(self.lst_ext.count())
-        ]
-        self.sts.setValue("ext_items", json.dumps(items))
+        text = self.le_filter.text()
+        if text != self._init_filter:
+            self.sts.setValue("filter_text", text)
+        lst, checked = self.lst_ext, Qt.Checked
+        items = tuple((it.text(), it.checkState() == checked)
+                      for it in map(lst.item, range(lst.count())))
+        if items != self._init_ext_payload:
+            self.sts.write_array("ext_items", items, "t", "c")
+            self.sts.remove("ext_items")
+        self.sts.flush()
         super().closeEvent(e)
 
 # ────────── entry point ─────────────────────────────────────────────
 def main():
     app = QApplication(sys.argv)
-    if LOGO_PNG.exists():
-        app.setWindowIcon(QIcon(str(LOGO_PNG)))
+    if _logo_icon():
+        app.setWindowIcon(_logo_icon())
     win = MainWindow()
+    win.setWindowState(win.windowState() | Qt.WindowMaximized)
     win.show()
-    QTimer.singleShot(0, win.showMaximized)
     sys.exit(app.exec())
 
 if __name__ == "__main__":